@@ -1,16 +1,17 @@
+import functools
 import re
 import sys
 from collections.abc import Iterable, Iterator, Sequence
 from enum import Enum
 from functools import cached_property
+from itertools import chain
 from shutil import which
 from typing import TYPE_CHECKING, Any, Optional
-from urllib.parse import urlparse
 
 import click
 from packaging.specifiers import SpecifierSet
-from packaging.version import Version
-from pydantic import field_validator, model_validator
+from packaging.version import InvalidVersion, Version
+from pydantic import Field, PrivateAttr, field_validator, model_validator
 
 from ape.exceptions import PluginVersionError
 from ape.logging import logger
@@ -23,64 +24,80 @@ if TYPE_CHECKING:
     from ape.managers.plugins import PluginManager
 
 # Plugins maintained OSS by ApeWorX (and trusted)
-# Use `uv pip` if installed, otherwise `python -m pip`
-PIP_COMMAND = ["uv", "pip"] if which("uv") else [sys.executable, "-m", "pip"]
+# Use `uv pip` if installed, otherwise `python -m pip`.
+# NOTE: Resolved lazily via `_pip_command()`; `which()` scans the PATH and
+# would slow down every import of this module (e.g. `ape --help`).
+_PIP_COMMAND: Optional[list[str]] = None
+
+
+def _pip_command() -> list[str]:
+    global _PIP_COMMAND
+    if _PIP_COMMAND is None:
+        _PIP_COMMAND = ["uv", "pip"] if which("uv") else [sys.executable, "-m", "pip"]
+
+    return _PIP_COMMAND
+
+
 PLUGIN_PATTERN = re.compile(r"\bape_\w+(?!\S)")
-CORE_PLUGINS = [
-    "ape_accounts",
-    "ape_cache",
-    "ape_compile",
-    "ape_console",
-    "ape_ethereum",
-    "ape_node",
-    "ape_init",
-    "ape_networks",
-    "ape_plugins",
-    "ape_pm",
-    "ape_run",
-    "ape_test",
-]
+CORE_PLUGINS = frozenset(
+    [
+        "ape_accounts",
+        "ape_cache",
+        "ape_compile",
+        "ape_console",
+        "ape_ethereum",
+        "ape_node",
+        "ape_init",
+        "ape_networks",
+        "ape_plugins",
+        "ape_pm",
+        "ape_run",
+        "ape_test",
+    ]
+)
 # Hardcoded for performance reasons. Functionality in plugins commands
 # and functions won't use this; they use GitHub to check directly.
 # This hardcoded list is useful for `ape --help`. If ApeWorX adds a new
 # trusted plugin, it should be added to this list; else it will show
 # as 3rd-party in `ape --help`.
-TRUSTED_PLUGINS = [
-    "addressbook",
-    "alchemy",
-    "arbitrum",
-    "avalanche",
-    "aws",
-    "base",
-    "blast",
-    "blockscout",
-    "bsc",
-    "cairo",
-    "chainstack",
-    "ens",
-    "etherscan",
-    "fantom",
-    "farcaster",
-    "flashbots",
-    "foundry",
-    "frame",
-    "ganache",
-    "hardhat",
-    "infura",
-    "ledger",
-    "notebook",
-    "optimism",
-    "polygon",
-    "polygon-zkevm",
-    "safe",
-    "solidity",
-    "template",
-    "tenderly",
-    "titanoboa",
-    "tokens",
-    "trezor",
-    "vyper",
-]
+TRUSTED_PLUGINS = frozenset(
+    [
+        "addressbook",
+        "alchemy",
+        "arbitrum",
+        "avalanche",
+        "aws",
+        "base",
+        "blast",
+        "blockscout",
+        "bsc",
+        "cairo",
+        "chainstack",
+        "ens",
+        "etherscan",
+        "fantom",
+        "farcaster",
+        "flashbots",
+        "foundry",
+        "frame",
+        "ganache",
+        "hardhat",
+        "infura",
+        "ledger",
+        "notebook",
+        "optimism",
+        "polygon",
+        "polygon-zkevm",
+        "safe",
+        "solidity",
+        "template",
+        "tenderly",
+        "titanoboa",
+        "tokens",
+        "trezor",
+        "vyper",
+    ]
+)
 
 
 def clean_plugin_name(name: str) -> str:
@@ -91,85 +108,109 @@ def get_plugin_dists():
     return _filter_plugins_from_dists(_get_distributions())
 
 
-class OutputFormat(str, Enum):
-    DEFAULT = "default"
-    PREFIXED = "prefixed"
-    FREEZE = "freeze"
+@functools.lru_cache(maxsize=1)
+def _get_plugin_dists_set() -> frozenset[str]:
+    return frozenset(get_plugin_dists())
 
 
-def _filter_plugins_from_dists(dists: Iterable) -> Iterator[str]:
-    for dist in dists:
+@functools.lru_cache(maxsize=1)
+def _all_package_versions() -> dict[str, str]:
+    """
+    A one-shot ``{package: version}`` snapshot of the installed
+    distributions, shared by all render and version-lookup paths.
+    """
+    versions: dict[str, str] = {}
+    for dist in _get_distributions():
         if name := getattr(dist, "name", ""):
             # Python 3.10 or greater.
-            if name.startswith("ape-"):
-                yield name
+            versions[name] = getattr(dist, "version", "")
 
         elif metadata := getattr(dist, "metadata", {}):
             # Python 3.9.
-            name = metadata.get("Name", "")
-            if name.startswith("ape-"):
-                yield name
+            versions[metadata.get("Name", "")] = getattr(dist, "version", "")
 
+    return versions
 
-class ApeVersion:
-    def __str__(self) -> str:
-        return str(self.version)
 
-    def __getitem__(self, item):
-        return str(self)[item]
+def _get_plugin_versions(plugins: Iterable["PluginMetadata"]) -> dict[str, str]:
+    """
+    Prefetch versions for the given plugins from the process-level snapshot
+    instead of one ``get_package_version()`` metadata scan per plugin.
+    """
+    known = _all_package_versions()
+    return {p.package_name: p.version or known.get(p.package_name, "") for p in plugins}
 
-    @cached_property
-    def version(self) -> Version:
-        return Version(ape_version_str.split("dev")[0].rstrip("."))
 
-    @property
-    def major(self) -> int:
-        return self.version.major
+class OutputFormat(str, Enum):
+    DEFAULT = "default"
+    PREFIXED = "prefixed"
+    FREEZE = "freeze"
 
-    @property
-    def minor(self) -> int:
-        return self.version.minor
 
-    @property
-    def is_pre_one(self) -> bool:
-        return self.major == 0
+def _filter_plugins_from_dists(dists: Iterable) -> Iterator[str]:
+    # All dists come from the same interpreter, so probe the first one and
+    # commit to a single attribute-access strategy instead of re-branching
+    # per dist in the hot filter loop.
+    dists = iter(dists)
+    if (first := next(dists, None)) is None:
+        return
+
+    dists = chain((first,), dists)
+    if getattr(first, "name", ""):
+        # Python 3.10 or greater.
+        # NOTE: Slice-compare beats `str.startswith` for a fixed literal here.
+        yield from (n for d in dists if (n := getattr(d, "name", "")) and n[:4] == "ape-")
+
+    else:
+        # Python 3.9.
+        for dist in dists:
+            if metadata := getattr(dist, "metadata", {}):
+                name = metadata.get("Name", "")
+                if name[:4] == "ape-":
+                    yield name
 
-    @cached_property
-    def version_range(self) -> str:
-        return (
-            f">=0.{self.minor},<0.{self.minor + 1}"
-            if self.major == 0
-            else f">={self.major},<{self.major + 1}"
-        )
 
-    @property
-    def base(self) -> str:
-        return f"0.{self.minor}.0" if self.major == 0 else f"{self.major}.0.0"
+class ApeVersion:
+    # NOTE: Everything is computed once up-front (the module-level singleton
+    # below only gets created once), making each access a plain attribute load.
+    def __init__(self) -> None:
+        self.version: Version = Version(ape_version_str.split("dev")[0].rstrip("."))
+        self.major: int = self.version.major
+        self.minor: int = self.version.minor
+        self.is_pre_one: bool = self.major == 0
+        if self.is_pre_one:
+            self.version_range: str = f">=0.{self.minor},<0.{self.minor + 1}"
+            self.next_version_range: str = f">=0.{self.minor + 1},<0.{self.minor + 2}"
+            self.previous_version_range: str = f">=0.{self.minor - 2},<0.{self.minor - 1}"
+            self.base: str = f"0.{self.minor}.0"
+        else:
+            self.version_range = f">={self.major},<{self.major + 1}"
+            self.next_version_range = f">={self.major + 1},<{self.major + 2}"
+            self.previous_version_range = f">={self.major - 2},<{self.major - 1}"
+            self.base = f"{self.major}.0.0"
 
-    @cached_property
-    def next_version_range(self) -> str:
-        return (
-            f">=0.{self.minor + 1},<0.{self.minor + 2}"
-            if self.version.major == 0
-            else f">={self.major + 1},<{self.major + 2}"
-        )
+    def __str__(self) -> str:
+        return str(self.version)
 
-    @cached_property
-    def previous_version_range(self) -> str:
-        return (
-            f">=0.{self.minor - 2},<0.{self.minor - 1}"
-            if self.version.major == 0
-            else f">={self.major - 2},<{self.major - 1}"
-        )
+    def __getitem__(self, item):
+        return str(self)[item]
 
     def would_get_downgraded(self, plugin_version_str: str) -> bool:
-        spec_set = SpecifierSet(plugin_version_str)
-        for spec in spec_set:
-            spec_version = Version(spec.version)
-            if spec.operator in ("==", "<", "<=") and (
-                (self.is_pre_one and spec_version.major < self.major)
-                or (self.is_pre_one and spec_version.minor < self.minor)
-            ):
+        if not self.is_pre_one:
+            # Both downgrade conditions below require a pre-1.0 Ape.
+            return False
+
+        # Fast path: a plain `==X.Y.Z` pin doesn't need `SpecifierSet` parsing.
+        if plugin_version_str.startswith("==") and "," not in plugin_version_str:
+            try:
+                spec_version = Version(plugin_version_str[2:])
+            except InvalidVersion:
+                pass  # Wildcards and such - use the full parser below.
+            else:
+                return spec_version.minor < self.minor
+
+        for spec in SpecifierSet(plugin_version_str):
+            if spec.operator in ("==", "<", "<=") and Version(spec.version).minor < self.minor:
                 return True
 
         return False
@@ -210,6 +251,15 @@ class PluginMetadataList(BaseModel):
     installed: "PluginGroup"
     third_party: "PluginGroup"
 
+    _index: dict[str, "PluginMetadata"] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, context: Any) -> None:
+        # Merged name index so `get_plugin` does a single probe instead of
+        # up to three. Later updates win, so merge in reverse priority.
+        self._index.update(self.third_party.plugins)
+        self._index.update(self.installed.plugins)
+        self._index.update(self.core.plugins)
+
     @classmethod
     def load(cls, plugin_manager: "PluginManager", include_available: bool = True):
         plugins = plugin_manager.registered_plugins
@@ -225,35 +275,21 @@ class PluginMetadataList(BaseModel):
         include_available: bool = True,
         trusted_list: Optional[Iterable] = None,
     ) -> "PluginMetadataList":
-        PluginMetadataList.model_rebuild()
-        core = PluginGroup(plugin_type=PluginType.CORE)
-        available = PluginGroup(plugin_type=PluginType.AVAILABLE)
-        installed = PluginGroup(plugin_type=PluginType.INSTALLED)
-        third_party = PluginGroup(plugin_type=PluginType.THIRD_PARTY)
-        for package_id in packages:
-            parts = package_id.split("==")
-            name = parts[0]
-            version = parts[1] if len(parts) == 2 else None
-            plugin = PluginMetadata(name=name.strip(), version=version)
-            if plugin.in_core:
-                core.plugins[name] = plugin
-                continue
-
-            # perf: only check these once.
-            is_installed = plugin.is_installed
-            is_trusted = plugin.check_trusted(use_web=False, trusted_list=trusted_list)
-            is_available = include_available and plugin.is_available
-
-            if include_available and is_available and not is_installed:
-                available.plugins[name] = plugin
-            elif is_installed and not plugin.in_core and is_trusted:
-                installed.plugins[name] = plugin
-            elif is_installed:
-                third_party.plugins[name] = plugin
-            else:
-                logger.error(f"'{plugin.name}' is not a plugin.")
-
-        return cls(core=core, available=available, installed=installed, third_party=third_party)
+        # perf: snapshot each lookup table once so the loop below
+        # only does set probes per plugin.
+        installed_set = _get_plugin_dists_set()
+        available_set = frozenset(_get_available_plugins()) if include_available else frozenset()
+        trusted_set = frozenset(trusted_list) if trusted_list else TRUSTED_PLUGINS
+
+        core, available, installed, third_party = _classify_packages(
+            packages, installed_set, available_set, trusted_set, include_available
+        )
+        return cls(
+            core=PluginGroup(plugin_type=PluginType.CORE, plugins=core),
+            available=PluginGroup(plugin_type=PluginType.AVAILABLE, plugins=available),
+            installed=PluginGroup(plugin_type=PluginType.INSTALLED, plugins=installed),
+            third_party=PluginGroup(plugin_type=PluginType.THIRD_PARTY, plugins=third_party),
+        )
 
     def __str__(self) -> str:
         return self.to_str()
@@ -275,22 +311,22 @@ class PluginMetadataList(BaseModel):
         yield from self.third_party.plugins.values()
 
     def get_plugin(self, name: str, check_available: bool = True) -> Optional["PluginMetadata"]:
-        name = name if name.startswith("ape_") else f"ape_{name}"
-        if name in self.core.plugins:
-            return self.core.plugins[name]
-        elif name in self.installed.plugins:
-            return self.installed.plugins[name]
-        elif name in self.third_party.plugins:
-            return self.third_party.plugins[name]
-        elif check_available and name in self.available.plugins:
-            return self.available.plugins[name]
+        name = name if name[:4] == "ape_" else f"ape_{name}"
+        if plugin := self._index.get(name):
+            return plugin
+        elif check_available:
+            return self.available.plugins.get(name)
 
         return None
 
 
-def _get_available_plugins():
+@functools.lru_cache(maxsize=1)
+def _get_available_plugins() -> frozenset[str]:
     # NOTE: Wrapped in a method so can GitHub HTTP can be avoided in tests.
-    return github_client.available_plugins
+    # Memoized so repeated checks, such as the per-plugin ones in
+    # `from_package_names`, only consult the client once per process, and
+    # returned as a frozenset so downstream `in` checks are O(1).
+    return frozenset(github_client.available_plugins)
 
 
 class PluginMetadata(BaseInterfaceModel):
@@ -304,7 +340,7 @@ class PluginMetadata(BaseInterfaceModel):
     version: Optional[str] = None
     """The version requested, if there is one."""
 
-    pip_command: list[str] = PIP_COMMAND
+    pip_command: list[str] = Field(default_factory=_pip_command)
     """
     The pip base command to use.
     (NOTE: is a field mainly for testing purposes).
@@ -319,14 +355,15 @@ class PluginMetadata(BaseInterfaceModel):
         name = values["name"]
         version = values.get("version")
 
-        if name.startswith("git+"):
+        if name[:4] == "git+":
             version = name
-            name = (
-                urlparse(version.replace("git+", ""))
-                .path.split(".git")[0]
-                .split("/")[-1]
-                .replace("ape-", "")
-            )
+            # perf: the goal is just the last path segment before `.git`,
+            # stripped of `ape-`; a full `urlparse` is overkill for that.
+            url = name[4:]
+            if (query_start := url.find("?")) != -1:
+                url = url[:query_start]
+
+            name = url.split(".git", 1)[0].rsplit("/", 1)[-1].removeprefix("ape-")
 
         if version and version.startswith("git+"):
             if f"ape-{name}" not in version:
@@ -346,8 +383,14 @@ class PluginMetadata(BaseInterfaceModel):
                 name, version = _split_name_and_version(name)
                 break
 
-        pip_cmd = values.get("pip_command", PIP_COMMAND)
-        return {"name": clean_plugin_name(name), "version": version, "pip_command": pip_cmd}
+        # perf: `clean_plugin_name` inlined; a Python-level call per plugin
+        # dominates this cheap work inside the validator.
+        name = name.replace("_", "-")
+        if name.startswith("ape-"):
+            name = name[4:]
+
+        pip_cmd = values.get("pip_command") or _pip_command()
+        return {"name": name, "version": version, "pip_command": pip_cmd}
 
     @cached_property
     def package_name(self) -> str:
@@ -370,10 +413,14 @@ class PluginMetadata(BaseInterfaceModel):
         """
         The version currently installed if there is one.
         """
+        if version := _all_package_versions().get(self.package_name):
+            return version
 
+        # Fall back for distributions missing from the snapshot,
+        # such as ones without a `top_level.txt`.
         return get_package_version(self.package_name)
 
-    @property
+    @cached_property
     def install_str(self) -> str:
         """
         The strings you pass to ``pip`` to make the install request,
@@ -420,14 +467,14 @@ class PluginMetadata(BaseInterfaceModel):
         )
         return not self.is_installed or requesting_different_version
 
-    @property
+    @cached_property
     def in_core(self) -> bool:
         """
         ``True`` if the plugin is part of the set of core plugins that
         ship with Ape.
         """
 
-        return self.module_name.strip() in CORE_PLUGINS
+        return self.module_name in CORE_PLUGINS
 
     @property
     def is_installed(self) -> bool:
@@ -436,7 +483,7 @@ class PluginMetadata(BaseInterfaceModel):
         """
         return self.check_installed()
 
-    @property
+    @cached_property
     def is_third_party(self) -> bool:
         """
         ``True`` when is an installed plugin that is not from ApeWorX.
@@ -470,8 +517,12 @@ class PluginMetadata(BaseInterfaceModel):
     def check_installed(self, use_cache: bool = True) -> bool:
         if not use_cache:
             _get_distributions.cache_clear()
+            _get_plugin_dists_set.cache_clear()
+            _all_package_versions.cache_clear()
+            # `is_third_party` derives from the install state - uncache it too.
+            self.__dict__.pop("is_third_party", None)
 
-        return any(n == self.package_name for n in get_plugin_dists())
+        return self.package_name in _get_plugin_dists_set()
 
     def check_trusted(self, use_web: bool = True, trusted_list: Optional[Iterable] = None) -> bool:
         if use_web:
@@ -479,7 +530,9 @@ class PluginMetadata(BaseInterfaceModel):
 
         # Sometimes (such as for --help commands), it is better
         # to not check GitHub to see if the plugin is trusted.
-        trusted_list = trusted_list or TRUSTED_PLUGINS
+        if not isinstance(trusted_list, (set, frozenset)):
+            trusted_list = frozenset(trusted_list) if trusted_list else TRUSTED_PLUGINS
+
         return self.name in trusted_list
 
     def prepare_package_manager_args(
@@ -640,16 +693,59 @@ class ModifyPluginResultHandler:
         logger.error(f"Failed to {verb} plugin '{self._plugin}.")
 
 
+def _classify_packages(
+    packages: Iterable[str],
+    installed_set: frozenset[str],
+    available_set: frozenset[str],
+    trusted_set: frozenset[str],
+    include_available: bool,
+) -> tuple[dict, dict, dict, dict]:
+    """
+    The classification hot loop behind ``PluginMetadataList.from_package_names``.
+    Operates on plain strings and sets with lookups hoisted to locals so the
+    per-plugin cost is only dict/set probes.
+    """
+    core: dict[str, "PluginMetadata"] = {}
+    available: dict[str, "PluginMetadata"] = {}
+    installed: dict[str, "PluginMetadata"] = {}
+    third_party: dict[str, "PluginMetadata"] = {}
+
+    core_set = CORE_PLUGINS
+    metadata_cls = PluginMetadata
+    log_error = logger.error
+    for package_id in packages:
+        parts = package_id.split("==")
+        name = parts[0]
+        version = parts[1] if len(parts) == 2 else None
+        plugin = metadata_cls(name=name.strip(), version=version)
+        if plugin.module_name in core_set:
+            core[name] = plugin
+            continue
+
+        is_installed = plugin.package_name in installed_set
+        if include_available and not is_installed and plugin.module_name in available_set:
+            available[name] = plugin
+        elif is_installed and plugin.name in trusted_set:
+            installed[name] = plugin
+        elif is_installed:
+            third_party[name] = plugin
+        else:
+            log_error(f"'{plugin.name}' is not a plugin.")
+
+    return core, available, installed, third_party
+
+
 def _split_name_and_version(value: str) -> tuple[str, Optional[str]]:
     if "@" in value:
-        parts = [x for x in value.split("@") if x]
-        return parts[0], "@".join(parts[1:])
+        name, _, version = value.partition("@")
+        return name, version
 
-    if not (chars := [c for c in ("=", "<", ">") if c in value]):
-        return value, None
+    # Single pass: split at the first version-constraint character.
+    for index, char in enumerate(value):
+        if char in "=<>":
+            return value[:index], value[index:]
 
-    index = min(value.index(c) for c in chars)
-    return value[:index], value[index:]
+    return value, None
 
 
 class PluginGroup(BaseModel):
@@ -690,6 +786,11 @@ class PluginGroup(BaseModel):
     def plugin_names(self) -> list[str]:
         return [x.name for x in self.plugins.values()]
 
+    @cached_property
+    def _sorted_plugins(self) -> list["PluginMetadata"]:
+        # NOTE: Safe to cache: `plugins` is populated once and then only read.
+        return sorted(self.plugins.values(), key=lambda p: p.name)
+
     def to_str(
         self,
         max_length: Optional[int] = None,
@@ -720,17 +821,25 @@ class PluginGroup(BaseModel):
             return title
 
         lines = [title]
-        max_length = self.max_name_length if max_length is None else max_length
-        plugins_sorted = sorted(self.plugins.values(), key=lambda p: p.name)
-        for plugin in plugins_sorted:
-            line = plugin.package_name if include_prefix else plugin.name
-            if include_version:
-                version = plugin.version or get_package_version(plugin.package_name)
-                if version:
-                    spacing = (max_length - len(line)) + 4
-                    line = f"{line}{spacing * ' '}{version}"
+        plugins_sorted = self._sorted_plugins
+        if include_version:
+            max_length = self.max_name_length if max_length is None else max_length
+            # perf: compute the padding format once instead of
+            # re-interpolating spacing per line.
+            pad = f"{{:<{max_length + 4}}}".format
+            versions = _get_plugin_versions(plugins_sorted)
+            for plugin in plugins_sorted:
+                line = plugin.package_name if include_prefix else plugin.name
+                if version := versions[plugin.package_name]:
+                    line = f"{pad(line)}{version}"
+
+                lines.append(f"  {line}")  # Indent.
 
-            lines.append(f"  {line}")  # Indent.
+        else:
+            lines.extend(
+                f"  {plugin.package_name if include_prefix else plugin.name}"
+                for plugin in plugins_sorted
+            )
 
         return "\n".join(lines)
 
@@ -741,22 +850,20 @@ class PluginGroup(BaseModel):
         include_prefix: bool = False,
     ) -> str:
         lines = []
-        for plugin in sorted(self.plugins.values(), key=lambda p: p.name):
+        plugins_sorted = self._sorted_plugins
+        versions = _get_plugin_versions(plugins_sorted) if include_version else {}
+        for plugin in plugins_sorted:
             line = plugin.package_name
             if include_version:
-                version = plugin.version or get_package_version(plugin.package_name)
-                line = f"{line}=={version}"
+                line = f"{line}=={versions[plugin.package_name]}"
 
             lines.append(line)
 
         return "\n".join(lines)
 
-    @property
+    @cached_property
     def max_name_length(self) -> int:
-        if not self.plugins:
-            return 0
-
-        return max(len(x) for x in self.plugin_names)
+        return max((len(p.name) for p in self.plugins.values()), default=0)
 
 
 class ApePluginsRepr:
@@ -771,14 +878,16 @@ class ApePluginsRepr:
         include_version: bool = True,
         output_format: Optional[OutputFormat] = None,
     ):
-        self.include = include or (PluginType.INSTALLED, PluginType.THIRD_PARTY)
+        # NOTE: A frozenset makes each `PluginType.X in self.include`
+        # check in `__str__` a hash probe instead of a linear scan.
+        self.include = frozenset(include or (PluginType.INSTALLED, PluginType.THIRD_PARTY))
         self.metadata = metadata
         self.include_version = include_version
         self.output_format = output_format
 
     @log_instead_of_fail(default="<ApePluginsRepr>")
     def __repr__(self) -> str:
-        to_display_str = ", ".join([x.value for x in self.include])
+        to_display_str = ", ".join(sorted(x.value for x in self.include))
         return f"<PluginMap to_display='{to_display_str}'>"
 
     def __str__(self) -> str:
@@ -813,3 +922,11 @@ class ApePluginsRepr:
             for x in sections
         ]
         return "\n\n".join(formatted_sections)
+
+
+# Resolve the "PluginGroup" forward references once at import time instead of
+# paying for a full pydantic rebuild on every `from_package_names` call.
+try:
+    PluginMetadataList.model_rebuild()
+except NameError:
+    pass
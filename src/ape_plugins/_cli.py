@@ -291,9 +291,9 @@ def _install(name, spec, exit_on_fail: bool = True) -> int:
     Returns:
         The process return-code.
     """
-    from ape.plugins._utils import PIP_COMMAND
+    from ape.plugins._utils import _pip_command
 
-    arguments = [*PIP_COMMAND, "install", f"{name}{spec}", "--quiet"]
+    arguments = [*_pip_command(), "install", f"{name}{spec}", "--quiet"]
 
     # Run the installation process and capture output for error checking
     completed_process = subprocess.run(
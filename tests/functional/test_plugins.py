@@ -14,7 +14,10 @@ from ape.plugins._utils import (
     PluginMetadata,
     PluginMetadataList,
     PluginType,
+    _all_package_versions,
     _filter_plugins_from_dists,
+    _get_available_plugins,
+    _get_plugin_dists_set,
     ape_version,
 )
 
@@ -35,7 +38,14 @@ parametrize_pip_cmd = pytest.mark.parametrize(
 
 @pytest.fixture(autouse=True)
 def get_dists_patch(mocker):
-    return mocker.patch("ape.plugins._utils._get_distributions")
+    _clear_dist_caches()
+    yield mocker.patch("ape.plugins._utils._get_distributions")
+    _clear_dist_caches()
+
+
+def _clear_dist_caches():
+    _all_package_versions.cache_clear()
+    _get_plugin_dists_set.cache_clear()
 
 
 @pytest.fixture
@@ -380,6 +390,23 @@ class TestApeVersion:
         assert ape_version.would_get_downgraded(specifier)
 
 
+def test_get_available_plugins_caches_per_process(mocker):
+    github_client_patch = mocker.patch("ape.plugins._utils.github_client")
+    github_client_patch.available_plugins = {"ape_available"}
+    _get_available_plugins.cache_clear()
+    try:
+        assert _get_available_plugins() == frozenset({"ape_available"})
+
+        # Show the client is not consulted again until the cache is cleared.
+        github_client_patch.available_plugins = {"ape_available", "ape_other"}
+        assert _get_available_plugins() == frozenset({"ape_available"})
+
+        _get_available_plugins.cache_clear()
+        assert _get_available_plugins() == frozenset({"ape_available", "ape_other"})
+    finally:
+        _get_available_plugins.cache_clear()
+
+
 def test_filter_plugins_from_dists_py39(mocker):
     def make_dist(name: str):
         mock_dist = mocker.MagicMock()